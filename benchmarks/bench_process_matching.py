@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark - EA process name matching on a synthetic process table
+Compares the legacy per-process any(lower()) scan with ProcessNameMatcher
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_manager import ProcessManager, ProcessNameMatcher
+
+
+def build_process_table(size=10000, match_every=500, seed=42):
+    """Build a synthetic process table of (pid, name) pairs"""
+    rng = random.Random(seed)
+    ea_names = ProcessManager().ea_process_names
+    table = []
+    for pid in range(1, size + 1):
+        if pid % match_every == 0:
+            name = rng.choice(ea_names)
+        else:
+            stem = ''.join(rng.choice(string.ascii_letters) for _ in range(rng.randint(4, 20)))
+            name = f"{stem}.exe"
+        table.append((pid, name))
+    return table
+
+
+def legacy_match(table, ea_process_names):
+    """Original find_ea_processes matching: lowercase everything, every time"""
+    return [pid for pid, name in table
+            if name and any(ea_name.lower() in name.lower() for ea_name in ea_process_names)]
+
+
+def compiled_match(table, matcher):
+    """Matching with the precompiled name set + substring automaton"""
+    return [pid for pid, name in table if matcher.matches(name)]
+
+
+def timed(func, *args, repeat=5):
+    """Return (best time in seconds, last result)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    table = build_process_table()
+    ea_process_names = ProcessManager().ea_process_names
+    matcher = ProcessNameMatcher(ea_process_names)
+
+    legacy_time, legacy_result = timed(legacy_match, table, ea_process_names)
+    compiled_time, compiled_result = timed(compiled_match, table, matcher)
+
+    assert legacy_result == compiled_result, "Matchers disagree"
+
+    print(f"Synthetic process table: {len(table)} processes, {len(compiled_result)} EA matches")
+    print(f"Legacy any(lower()) match: {legacy_time * 1000:8.2f} ms")
+    print(f"ProcessNameMatcher:        {compiled_time * 1000:8.2f} ms")
+    print(f"Speedup:                   {legacy_time / compiled_time:8.2f}x")
+    print(f"exe lookups: legacy {len(table)}, lazy {len(compiled_result)}")
+
+
+if __name__ == "__main__":
+    main()
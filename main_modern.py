@@ -53,6 +53,11 @@ class ModernBF3LicenseFixerGUI:
         
         # Check admin privileges on startup
         self.check_admin_privileges()
+        
+        # Start the shared EA process monitor that feeds the status panel
+        self.ea_monitor = self.process_manager.start_monitor()
+        self.ea_monitor.subscribe(self.on_ea_processes_changed)
+        self.root.bind("<Destroy>", self.on_destroy, add="+")
     
     def setup_modern_gui(self):
         """Create the modern GUI interface"""
@@ -166,6 +171,17 @@ class ModernBF3LicenseFixerGUI:
                                      style="secondary", width=120, height=35)
         clear_button.pack(side='left')
         
+        # Live EA process status card
+        status_card = ModernCard(button_frame, title="EA Status")
+        status_card.pack(fill='x', pady=(0, 10))
+        
+        self.ea_status_label = tk.Label(status_card.content_frame,
+                                       text="Checking for EA App/Origin processes...",
+                                       bg='#2d2d2d', fg='#cccccc',
+                                       font=('Segoe UI', 9), anchor='w',
+                                       justify='left')
+        self.ea_status_label.pack(fill='x')
+        
         # Add tooltips
         ModernTooltip(self.fix_button, "Start the automated license fix process")
         ModernTooltip(self.restore_button, "Restore files from the most recent backup")
@@ -258,6 +274,26 @@ class ModernBF3LicenseFixerGUI:
         except Exception as e:
             self.log_message(f"Could not check admin privileges: {e}", "error")
     
+    def on_ea_processes_changed(self, started, exited, running):
+        """Monitor callback - runs on the monitor thread, so hand off to Tk"""
+        self.root.after(0, lambda: self.update_ea_status_panel(running))
+    
+    def update_ea_status_panel(self, running):
+        """Refresh the EA status panel from the monitor's latest snapshot"""
+        if running:
+            names = sorted({process['name'] for process in running})
+            text = f"⚠️ {len(running)} EA processes running: {', '.join(names)}"
+            color = '#ff9800'
+        else:
+            text = "✅ No EA App/Origin processes running"
+            color = '#4caf50'
+        self.ea_status_label.config(text=text, fg=color)
+    
+    def on_destroy(self, event):
+        """Stop the EA process monitor when the main window closes"""
+        if event.widget is self.root:
+            self.process_manager.stop_monitor()
+    
     def log_message(self, message, level="info"):
         """Add a message to the modern log display"""
         from datetime import datetime
@@ -341,7 +377,8 @@ class ModernBF3LicenseFixerGUI:
             
             # Step 1: Check for running EA processes
             self.log_message("🔍 Step 1: Checking for running EA App/Origin processes...", "info")
-            running_processes = self.process_manager.find_ea_processes()
+            self.ea_monitor.scan_now()
+            running_processes = self.ea_monitor.get_running_processes()
             
             if running_processes:
                 self.log_message(f"Found {len(running_processes)} EA processes running", "warning")
@@ -6,11 +6,203 @@ import psutil
 import time
 import subprocess
 import logging
+import threading
+import re
+
+
+class ProcessNameMatcher:
+    """Precompiled matcher for process names.
+
+    Exact names are checked against a normalized set; anything else falls back
+    to a single compiled alternation so all substring patterns are tried in
+    one pass of the regex engine instead of one Python loop per pattern.
+    """
+
+    def __init__(self, names):
+        self.names = [name.lower() for name in names]
+        self.exact_names = set(self.names)
+        # Longest first so overlapping names don't shadow each other
+        pattern = '|'.join(re.escape(name) for name in sorted(self.exact_names, key=len, reverse=True))
+        self._search = re.compile(pattern).search if pattern else None
+
+    def matches(self, process_name):
+        """Check if a process name contains any of the target names"""
+        if not process_name or self._search is None:
+            return False
+
+        name = process_name.lower()
+        return name in self.exact_names or self._search(name) is not None
+
+
+class ProcessSnapshotCache:
+    """Incremental snapshot of the process table keyed by (pid, create_time)"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.entries = {}
+        self.processes = {}
+        self.last_new_count = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Rescan the process table, only fetching attributes for unseen processes"""
+        # Serialize scans so the monitor thread and the fix thread share one cache
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        """Rescan implementation, called with the lock held"""
+        current = {}
+        processes = {}
+        new_count = 0
+
+        for pid in psutil.pids():
+            try:
+                process = psutil.Process(pid)
+                # (pid, create_time) survives pid reuse, so a cached entry is
+                # only reused when it really is the same process
+                key = (pid, process.create_time())
+                entry = self.entries.get(key)
+                if entry is None:
+                    # exe is resolved lazily by get_exe(), only for matches
+                    entry = {
+                        'pid': pid,
+                        'create_time': key[1],
+                        'name': process.name()
+                    }
+                    new_count += 1
+                else:
+                    process = self.processes[key]
+                current[key] = entry
+                processes[key] = process
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                # Process may have terminated or we don't have access
+                continue
+
+        self.entries = current
+        self.processes = processes
+        self.last_new_count = new_count
+        self.logger.debug(f"Process snapshot refreshed: {len(current)} processes, {new_count} new")
+        return list(current.values())
+
+    def clear(self):
+        """Forget all cached processes so the next refresh is a full scan"""
+        with self._lock:
+            self.entries = {}
+            self.processes = {}
+
+    def get_exe(self, entry):
+        """Get the executable path for a cached entry, fetching it at most once"""
+        if 'exe' not in entry:
+            process = self.processes.get((entry['pid'], entry['create_time']))
+            exe = None
+            if process is not None:
+                try:
+                    exe = process.exe()
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    pass
+            entry['exe'] = exe
+        return entry['exe']
+
+
+class EAProcessMonitor:
+    """Background thread that scans for EA processes and publishes started/exited deltas"""
+
+    def __init__(self, process_manager, interval=2.0):
+        self.logger = logging.getLogger(__name__)
+        self.process_manager = process_manager
+        self.interval = interval
+
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+        self._running = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """Register callback(started, exited, running) invoked from the monitor thread"""
+        with self._subscribers_lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove a previously registered callback"""
+        with self._subscribers_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start(self):
+        """Start the monitor thread if it is not already running"""
+        if self.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="EAProcessMonitor")
+        self._thread.daemon = True
+        self._thread.start()
+        self.logger.info(f"EA process monitor started (interval: {self.interval}s)")
+
+    def stop(self, timeout=5):
+        """Stop the monitor thread and wait for it to exit"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.logger.info("EA process monitor stopped")
+
+    def is_alive(self):
+        """Check if the monitor thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_running_processes(self):
+        """Get the EA processes seen by the most recent scan"""
+        return list(self._running.values())
+
+    def scan_now(self):
+        """Run one scan and publish any changes to subscribers"""
+        current = {}
+        for process_info in self.process_manager.find_ea_processes():
+            current[process_info['pid']] = process_info
+
+        started = [info for pid, info in current.items() if pid not in self._running]
+        exited = [info for pid, info in self._running.items() if pid not in current]
+        self._running = current
+
+        if started or exited:
+            for process_info in started:
+                self.logger.info(f"EA process started: {process_info['name']} (PID: {process_info['pid']})")
+            for process_info in exited:
+                self.logger.info(f"EA process exited: {process_info['name']} (PID: {process_info['pid']})")
+            self._publish(started, exited)
+
+        return started, exited
+
+    def _publish(self, started, exited):
+        """Notify all subscribers of a change"""
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+
+        running = self.get_running_processes()
+        for callback in subscribers:
+            try:
+                callback(started, exited, running)
+            except Exception as e:
+                self.logger.error(f"Error in EA process monitor subscriber: {e}")
+
+    def _run(self):
+        """Monitor thread main loop"""
+        while not self._stop_event.is_set():
+            try:
+                self.scan_now()
+            except Exception as e:
+                self.logger.error(f"Error scanning EA processes: {e}")
+            self._stop_event.wait(self.interval)
 
 
 class ProcessManager:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.process_cache = ProcessSnapshotCache()
+        self.monitor = None
         
         # EA process names to look for
         self.ea_process_names = [
@@ -21,33 +213,50 @@ class ProcessManager:
             'EABackgroundService.exe',     # EA background service
             'EALaunchHelper.exe',          # EA launch helper
         ]
+        self._matcher = None
+        self._matcher_names = None
     
+    def start_monitor(self, interval=2.0):
+        """Start the shared background EA process monitor"""
+        if self.monitor is None:
+            self.monitor = EAProcessMonitor(self, interval)
+        self.monitor.start()
+        return self.monitor
+
+    def stop_monitor(self):
+        """Stop the background EA process monitor"""
+        if self.monitor is not None:
+            self.monitor.stop()
+
+    def get_matcher(self):
+        """Get the compiled matcher, rebuilding it if ea_process_names changed"""
+        names = tuple(self.ea_process_names)
+        if self._matcher is None or names != self._matcher_names:
+            self._matcher = ProcessNameMatcher(names)
+            self._matcher_names = names
+        return self._matcher
+
     def find_ea_processes(self):
         """Find all running EA-related processes"""
         running_processes = []
         
         try:
-            for process in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    process_name = process.info['name']
-                    if process_name and any(ea_name.lower() in process_name.lower() 
-                                          for ea_name in self.ea_process_names):
-                        running_processes.append({
-                            'pid': process.info['pid'],
-                            'name': process_name,
-                            'exe': process.info['exe']
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    # Process may have terminated or we don't have access
-                    continue
+            matcher = self.get_matcher()
+            for entry in self.process_cache.refresh():
+                if matcher.matches(entry['name']):
+                    running_processes.append({
+                        'pid': entry['pid'],
+                        'name': entry['name'],
+                        'exe': self.process_cache.get_exe(entry)
+                    })
                     
         except Exception as e:
             self.logger.error(f"Error finding EA processes: {e}")
         
         return running_processes
     
-    def terminate_ea_processes(self, timeout=30):
-        """Terminate all EA-related processes gracefully"""
+    def terminate_ea_processes(self, timeout=30, kill_timeout=5):
+        """Terminate all EA-related processes gracefully, force killing stragglers"""
         processes_to_terminate = self.find_ea_processes()
         
         if not processes_to_terminate:
@@ -56,57 +265,88 @@ class ProcessManager:
         
         self.logger.info(f"Attempting to terminate {len(processes_to_terminate)} EA processes")
         
-        # First, try graceful termination
-        terminated_pids = []
+        processes = []
         for process_info in processes_to_terminate:
             try:
-                process = psutil.Process(process_info['pid'])
+                processes.append(psutil.Process(process_info['pid']))
+            except psutil.NoSuchProcess:
+                # Already gone between the scan and now
+                continue
+            except psutil.AccessDenied as e:
+                self.logger.warning(f"Could not open {process_info['name']}: {e}")
+        
+        result = self.terminate_processes(processes, timeout, kill_timeout)
+        
+        if result['alive']:
+            self.logger.error(f"Failed to terminate {len(result['alive'])} EA processes")
+            return False
+        
+        self.logger.info("EA process termination completed")
+        return True
+    
+    def terminate_processes(self, processes, timeout=30, kill_timeout=5):
+        """Terminate processes with escalation: terminate -> kill -> report.
+        
+        Waits with psutil.wait_procs, so it returns as soon as the last
+        process exits instead of polling on a fixed interval.
+        """
+        names = {}
+        signalled = []
+        
+        # First, try graceful termination
+        for process in processes:
+            try:
+                names[process.pid] = process.name()
                 process.terminate()
-                terminated_pids.append(process_info['pid'])
-                self.logger.info(f"Sent terminate signal to {process_info['name']} (PID: {process_info['pid']})")
-            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                self.logger.warning(f"Could not terminate {process_info['name']}: {e}")
+                signalled.append(process)
+                self.logger.info(f"Sent terminate signal to {names[process.pid]} (PID: {process.pid})")
+            except psutil.NoSuchProcess:
+                continue
+            except (psutil.AccessDenied, psutil.ZombieProcess) as e:
+                self.logger.warning(f"Could not terminate {names.get(process.pid, process.pid)}: {e}")
+                signalled.append(process)
+        
+        def on_exit(process):
+            self.logger.info(f"{names.get(process.pid, 'Process')} (PID: {process.pid}) exited "
+                             f"with code {process.returncode}")
+        
+        gone = []
+        alive = signalled
         
         # Wait for processes to terminate gracefully
-        if terminated_pids:
+        if alive:
             self.logger.info(f"Waiting up to {timeout} seconds for processes to terminate...")
+            gone, alive = psutil.wait_procs(alive, timeout=timeout, callback=on_exit)
+        
+        # If some processes are still running, try force kill
+        killed = []
+        if alive:
+            self.logger.warning(f"Force killing {len(alive)} remaining processes")
+            for process in alive:
+                try:
+                    process.kill()
+                    killed.append(process)
+                    self.logger.info(f"Force killed process PID: {process.pid}")
+                except psutil.NoSuchProcess:
+                    killed.append(process)
+                except psutil.AccessDenied as e:
+                    self.logger.error(f"Could not force kill process PID {process.pid}: {e}")
             
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                still_running = []
-                for pid in terminated_pids:
-                    try:
-                        if psutil.pid_exists(pid):
-                            still_running.append(pid)
-                    except:
-                        pass
-                
-                if not still_running:
-                    self.logger.info("All EA processes terminated successfully")
-                    return True
-                
-                time.sleep(1)
-            
-            # If some processes are still running, try force kill
-            if still_running:
-                self.logger.warning(f"Force killing {len(still_running)} remaining processes")
-                for pid in still_running:
-                    try:
-                        process = psutil.Process(pid)
-                        process.kill()
-                        self.logger.info(f"Force killed process PID: {pid}")
-                    except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                        self.logger.error(f"Could not force kill process PID {pid}: {e}")
-                
-                # Final check
-                time.sleep(2)
-                final_check = self.find_ea_processes()
-                if final_check:
-                    self.logger.error(f"Failed to terminate {len(final_check)} EA processes")
-                    return False
+            gone_after_kill, alive = psutil.wait_procs(alive, timeout=kill_timeout, callback=on_exit)
+            gone += gone_after_kill
         
-        self.logger.info("EA process termination completed")
-        return True
+        # Report whatever survived both rounds
+        for process in alive:
+            self.logger.error(f"Process {names.get(process.pid, '')} (PID: {process.pid}) is still running")
+        
+        if not alive:
+            self.logger.info("All processes terminated successfully")
+        
+        return {
+            'gone': [process.pid for process in gone],
+            'killed': [process.pid for process in killed],
+            'alive': [process.pid for process in alive]
+        }
     
     def wait_for_process_shutdown(self, timeout=30):
         """Wait for all EA processes to shut down completely"""